@@ -363,22 +363,19 @@ var windowGetCmd = &cobra.Command{
 			return fmt.Errorf("invalid window ID: %v", err)
 		}
 
-		state, err := getState()
-		if err != nil {
-			return err
-		}
+		c := client.NewClient(socketPath, timeout)
+		defer c.Close()
 
-		window := state.FindWindowByID(windowID)
-		if window == nil {
-			return fmt.Errorf("window %d not found", windowID)
+		detail, err := c.GetWindow(context.Background(), windowID)
+		if err != nil {
+			return fmt.Errorf("failed to get window %d: %w", windowID, err)
 		}
 
 		if jsonOutput {
-			return printJSON(window)
+			return printJSON(detail.Window)
 		}
 
-		app := state.FindApplicationByPID(window.PID)
-		output.PrintWindowDetail(window, app)
+		output.PrintWindowDetail(detail.Window, detail.Application)
 		return nil
 	},
 }
@@ -2122,26 +2119,31 @@ Example JSON input:
 		c := client.NewClient(socketPath, timeout)
 		defer c.Close()
 
-		// 6. Apply window positions
-		var errors []string
-		successCount := 0
-
-		for _, win := range layout.Windows {
+		// 6. Apply window positions in a single batch
+		calls := make([]client.Call, len(layout.Windows))
+		for i, win := range layout.Windows {
 			// Convert normalized coordinates to absolute pixels
-			absX := win.X * displayWidth
-			absY := win.Y * displayHeight
-			absWidth := win.Width * displayWidth
-			absHeight := win.Height * displayHeight
-
 			updates := map[string]interface{}{
-				"x":       absX,
-				"y":       absY,
-				"width":   absWidth,
-				"height":  absHeight,
+				"x":       win.X * displayWidth,
+				"y":       win.Y * displayHeight,
+				"width":   win.Width * displayWidth,
+				"height":  win.Height * displayHeight,
 				"spaceId": spaceID,
 			}
+			calls[i] = client.UpdateWindowCall(win.ID, updates)
+		}
+
+		results, err := c.CallBatch(context.Background(), calls)
+		if err != nil {
+			printError(fmt.Sprintf("Failed to render layout: %v", err))
+			return err
+		}
 
-			result, err := c.UpdateWindow(context.Background(), win.ID, updates)
+		var errors []string
+		successCount := 0
+
+		for i, win := range layout.Windows {
+			result, err := results[i].Result, results[i].Err
 			if err != nil {
 				errors = append(errors, fmt.Sprintf("Window %d: %v", win.ID, err))
 				continue
@@ -2158,7 +2160,7 @@ Example JSON input:
 			successCount++
 			if !jsonOutput {
 				successColor.Printf("✓ Window %d positioned at (%.0f, %.0f) size %.0fx%.0f\n",
-					win.ID, absX, absY, absWidth, absHeight)
+					win.ID, win.X*displayWidth, win.Y*displayHeight, win.Width*displayWidth, win.Height*displayHeight)
 			}
 		}
 
@@ -2352,12 +2354,22 @@ func main() {
 
 // Helper functions
 
+// printJSON writes data to stdout as JSON. Output is indented only when stdout
+// is a terminal; piped output is read by tools like jq and stays compact.
 func printJSON(data interface{}) error {
 	enc := json.NewEncoder(os.Stdout)
-	enc.SetIndent("", "  ")
+	if stdoutIsTerminal() {
+		enc.SetIndent("", "  ")
+	}
 	return enc.Encode(data)
 }
 
+// stdoutIsTerminal reports whether stdout is attached to a terminal
+func stdoutIsTerminal() bool {
+	fi, err := os.Stdout.Stat()
+	return err == nil && fi.Mode()&os.ModeCharDevice != 0
+}
+
 func printError(msg string) {
 	if noColor {
 		fmt.Fprintln(os.Stderr, "Error:", msg)
@@ -2493,18 +2505,12 @@ func getState() (*models.State, error) {
 	c := client.NewClient(socketPath, timeout)
 	defer c.Close()
 
-	result, err := c.Dump(context.Background())
+	state, err := c.DumpState(context.Background())
 	if err != nil {
 		printError(fmt.Sprintf("Failed to get state: %v", err))
 		return nil, err
 	}
 
-	state, err := models.ParseState(result)
-	if err != nil {
-		printError(fmt.Sprintf("Failed to parse state: %v", err))
-		return nil, err
-	}
-
 	return state, nil
 }
 
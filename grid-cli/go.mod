@@ -4,7 +4,6 @@ go 1.21
 
 require (
 	github.com/fatih/color v1.16.0
-	github.com/google/uuid v1.5.0
 	github.com/olekukonko/tablewriter v1.1.1
 	github.com/rs/zerolog v1.34.0
 	github.com/spf13/cobra v1.8.0
@@ -3,9 +3,10 @@ package client
 import (
 	"context"
 	"fmt"
+	"strconv"
+	"sync/atomic"
 	"time"
 
-	"github.com/google/uuid"
 	"github.com/yourusername/grid-cli/internal/models"
 )
 
@@ -14,9 +15,22 @@ const (
 	DefaultTimeout    = 30 * time.Second
 )
 
+// Call is a single RPC sent as part of a batch
+type Call struct {
+	Method string
+	Params map[string]interface{}
+}
+
+// BatchResult is the outcome of one Call in a batch
+type BatchResult struct {
+	Result map[string]interface{}
+	Err    error
+}
+
 // Client is the main GridServer client
 type Client struct {
 	conn *Connection
+	seq  atomic.Uint64
 }
 
 // NewClient creates a new GridServer client
@@ -43,6 +57,13 @@ func (c *Client) Close() error {
 	return c.conn.Close()
 }
 
+// nextID returns a request ID unique to this client. Responses arrive on the
+// same connection, so a sequence number is enough to match them; the server
+// treats IDs as opaque strings.
+func (c *Client) nextID() string {
+	return strconv.FormatUint(c.seq.Add(1), 10)
+}
+
 // request is a helper to send a request and get the response
 func (c *Client) request(ctx context.Context, method string, params map[string]interface{}) (*models.Response, error) {
 	if !c.conn.IsConnected() {
@@ -51,7 +72,7 @@ func (c *Client) request(ctx context.Context, method string, params map[string]i
 		}
 	}
 
-	req := models.NewRequest(uuid.New().String(), method, params)
+	req := models.NewRequest(c.nextID(), method, params)
 	return c.conn.SendRequest(ctx, req)
 }
 
@@ -97,8 +118,78 @@ func (c *Client) Dump(ctx context.Context) (map[string]interface{}, error) {
 	return resp.Result, nil
 }
 
-// UpdateWindow updates a window's properties
-func (c *Client) UpdateWindow(ctx context.Context, windowID int, updates map[string]interface{}) (map[string]interface{}, error) {
+// typedResponse is a response whose result is decoded straight into T
+type typedResponse[T any] struct {
+	ID     string            `json:"id"`
+	Result *T                `json:"result,omitempty"`
+	Error  *models.ErrorInfo `json:"error,omitempty"`
+}
+
+// DumpState retrieves the complete window manager state, decoding the dump
+// result directly into a State rather than through an intermediate map
+func (c *Client) DumpState(ctx context.Context) (*models.State, error) {
+	if !c.conn.IsConnected() {
+		if err := c.Connect(); err != nil {
+			return nil, err
+		}
+	}
+
+	req := models.NewRequest(c.nextID(), "dump", map[string]interface{}{})
+	resps, err := roundTrip(ctx, c.conn, []*models.MessageEnvelope{req},
+		func(r *typedResponse[models.State]) string { return r.ID })
+	if err != nil {
+		return nil, err
+	}
+
+	resp := resps[0]
+	if resp.Error != nil {
+		return nil, fmt.Errorf("server error: %s", resp.Error.Message)
+	}
+
+	if resp.Result == nil {
+		return nil, fmt.Errorf("dump response has no result")
+	}
+
+	return resp.Result, nil
+}
+
+// WindowDetail is the result of getWindow: one window and its owning application
+type WindowDetail struct {
+	Window      *models.Window      `json:"window"`
+	Application *models.Application `json:"application,omitempty"`
+}
+
+// GetWindow retrieves a single window by ID without transferring the full state
+func (c *Client) GetWindow(ctx context.Context, windowID int) (*WindowDetail, error) {
+	if !c.conn.IsConnected() {
+		if err := c.Connect(); err != nil {
+			return nil, err
+		}
+	}
+
+	req := models.NewRequest(c.nextID(), "getWindow", map[string]interface{}{
+		"windowId": windowID,
+	})
+	resps, err := roundTrip(ctx, c.conn, []*models.MessageEnvelope{req},
+		func(r *typedResponse[WindowDetail]) string { return r.ID })
+	if err != nil {
+		return nil, err
+	}
+
+	resp := resps[0]
+	if resp.Error != nil {
+		return nil, fmt.Errorf("server error: %s", resp.Error.Message)
+	}
+
+	if resp.Result == nil || resp.Result.Window == nil {
+		return nil, fmt.Errorf("getWindow response has no window")
+	}
+
+	return resp.Result, nil
+}
+
+// UpdateWindowCall builds the updateWindow call for a window, for use with CallBatch
+func UpdateWindowCall(windowID int, updates map[string]interface{}) Call {
 	params := map[string]interface{}{
 		"windowId": windowID,
 	}
@@ -108,7 +199,13 @@ func (c *Client) UpdateWindow(ctx context.Context, windowID int, updates map[str
 		params[k] = v
 	}
 
-	resp, err := c.request(ctx, "updateWindow", params)
+	return Call{Method: "updateWindow", Params: params}
+}
+
+// UpdateWindow updates a window's properties
+func (c *Client) UpdateWindow(ctx context.Context, windowID int, updates map[string]interface{}) (map[string]interface{}, error) {
+	call := UpdateWindowCall(windowID, updates)
+	resp, err := c.request(ctx, call.Method, call.Params)
 	if err != nil {
 		return nil, err
 	}
@@ -133,3 +230,70 @@ func (c *Client) CallMethod(ctx context.Context, method string, params map[strin
 
 	return resp.Result, nil
 }
+
+// CallBatch sends all calls in a single write and waits for every response.
+// Results are returned in call order. Server errors are reported per call in
+// BatchResult.Err; the returned error covers connection failures only.
+func (c *Client) CallBatch(ctx context.Context, calls []Call) ([]BatchResult, error) {
+	batch, err := c.StartBatch(calls)
+	if err != nil {
+		return nil, err
+	}
+	return batch.Wait(ctx)
+}
+
+// PendingBatch is a batch of calls that has been sent but not yet answered
+type PendingBatch struct {
+	pending *Pending
+}
+
+// StartBatch sends all calls in a single write and returns without waiting,
+// so local work can overlap with the server handling them. The batch must be
+// waited on before the client sends anything else.
+func (c *Client) StartBatch(calls []Call) (*PendingBatch, error) {
+	if len(calls) == 0 {
+		return &PendingBatch{}, nil
+	}
+
+	if !c.conn.IsConnected() {
+		if err := c.Connect(); err != nil {
+			return nil, err
+		}
+	}
+
+	reqs := make([]*models.MessageEnvelope, len(calls))
+	for i, call := range calls {
+		reqs[i] = models.NewRequest(c.nextID(), call.Method, call.Params)
+	}
+
+	pending, err := c.conn.StartRequests(reqs)
+	if err != nil {
+		return nil, err
+	}
+
+	return &PendingBatch{pending: pending}, nil
+}
+
+// Wait reads the responses to the batch. Results are returned in call order,
+// with server errors reported per call as in CallBatch.
+func (b *PendingBatch) Wait(ctx context.Context) ([]BatchResult, error) {
+	if b.pending == nil {
+		return nil, nil
+	}
+
+	resps, err := b.pending.Wait(ctx)
+	if err != nil {
+		return nil, err
+	}
+
+	results := make([]BatchResult, len(resps))
+	for i, resp := range resps {
+		if resp.IsError() {
+			results[i].Err = fmt.Errorf("server error: %s", resp.GetError())
+			continue
+		}
+		results[i].Result = resp.Result
+	}
+
+	return results, nil
+}
@@ -1,7 +1,6 @@
 package client
 
 import (
-	"bufio"
 	"context"
 	"encoding/json"
 	"fmt"
@@ -11,11 +10,30 @@ import (
 	"github.com/yourusername/grid-cli/internal/models"
 )
 
+// readBufferSize is the size of the receive buffer allocated once per
+// connection. Most responses fit in a single fill; larger ones such as dump
+// need far fewer reads than with the 4KB bufio default.
+const readBufferSize = 64 * 1024
+
+// socketBufferSize is the kernel send/receive buffer requested for the
+// socket. The macOS default for Unix stream sockets is 8KB, which forces a
+// large dump response through many wakeups of the reader.
+const socketBufferSize = 1 << 20
+
+// responseEnvelope is the subset of MessageEnvelope needed to dispatch an
+// incoming frame, with the response decoded into R. Request and event
+// subtrees are skipped by the decoder instead of being materialized into maps.
+type responseEnvelope[R any] struct {
+	Type     string `json:"type"`
+	Response *R     `json:"response"`
+}
+
 // Connection manages the Unix domain socket connection to GridServer
 type Connection struct {
 	socketPath string
 	conn       net.Conn
-	reader     *bufio.Reader
+	frames     *frameReader
+	wbuf       []byte
 	timeout    time.Duration
 }
 
@@ -34,7 +52,14 @@ func (c *Connection) Connect() error {
 	if err != nil {
 		return fmt.Errorf("failed to connect to socket %s: %w", c.socketPath, err)
 	}
-	c.reader = bufio.NewReader(c.conn)
+
+	// Best effort: the kernel may clamp or refuse the size, and the
+	// defaults still work, only with more reads per large response
+	if uc, ok := c.conn.(*net.UnixConn); ok {
+		uc.SetReadBuffer(socketBufferSize)
+		uc.SetWriteBuffer(socketBufferSize)
+	}
+	c.frames = newFrameReader(c.conn, readBufferSize)
 	return nil
 }
 
@@ -48,71 +73,153 @@ func (c *Connection) Close() error {
 
 // SendRequest sends a request and waits for the response
 func (c *Connection) SendRequest(ctx context.Context, req *models.MessageEnvelope) (*models.Response, error) {
-	// Apply timeout if not already set
-	if _, ok := ctx.Deadline(); !ok && c.timeout > 0 {
-		var cancel context.CancelFunc
-		ctx, cancel = context.WithTimeout(ctx, c.timeout)
-		defer cancel()
+	resps, err := c.SendRequests(ctx, []*models.MessageEnvelope{req})
+	if err != nil {
+		return nil, err
 	}
+	return resps[0], nil
+}
 
-	// Marshal and send request
-	data, err := json.Marshal(req)
+// SendRequests sends all requests in a single write and waits for every
+// response. Responses are matched by request ID and returned in request order.
+func (c *Connection) SendRequests(ctx context.Context, reqs []*models.MessageEnvelope) ([]*models.Response, error) {
+	return roundTrip(ctx, c, reqs, func(r *models.Response) string { return r.ID })
+}
+
+// roundTrip sends all requests in a single write and waits for every response,
+// decoding each response into R. responseID extracts the request ID a decoded
+// response answers.
+func roundTrip[R any](ctx context.Context, c *Connection, reqs []*models.MessageEnvelope, responseID func(*R) string) ([]*R, error) {
+	index, err := writeRequests(c, reqs)
+	if err != nil {
+		return nil, err
+	}
+	return readResponses(ctx, c, index, responseID)
+}
+
+// Pending is a batch of requests that has been written to the connection but
+// whose responses have not been read yet. Wait must be called before anything
+// else is sent on the same connection.
+type Pending struct {
+	conn  *Connection
+	index map[string]int
+}
+
+// StartRequests sends all requests in a single write without waiting for the
+// responses, so the caller can do other work while the server handles them
+func (c *Connection) StartRequests(reqs []*models.MessageEnvelope) (*Pending, error) {
+	index, err := writeRequests(c, reqs)
 	if err != nil {
-		return nil, fmt.Errorf("failed to marshal request: %w", err)
+		return nil, err
+	}
+	return &Pending{conn: c, index: index}, nil
+}
+
+// Wait reads the responses to the pending requests, returned in request order
+func (p *Pending) Wait(ctx context.Context) ([]*models.Response, error) {
+	return readResponses(ctx, p.conn, p.index, func(r *models.Response) string { return r.ID })
+}
+
+// writeRequests frames every request into the reused write buffer and sends
+// them in a single write. It returns the position of each request ID.
+func writeRequests(c *Connection, reqs []*models.MessageEnvelope) (map[string]int, error) {
+	c.wbuf = c.wbuf[:0]
+	index := make(map[string]int, len(reqs))
+	for i, req := range reqs {
+		var err error
+		c.wbuf, err = req.Request.AppendEnvelopeJSON(c.wbuf)
+		if err != nil {
+			return nil, fmt.Errorf("failed to marshal request: %w", err)
+		}
+		c.wbuf = append(c.wbuf, '\n')
+		index[req.Request.ID] = i
 	}
 
-	// Send with newline delimiter
-	data = append(data, '\n')
 	if err := c.conn.SetWriteDeadline(time.Now().Add(c.timeout)); err != nil {
 		return nil, fmt.Errorf("failed to set write deadline: %w", err)
 	}
 
-	if _, err := c.conn.Write(data); err != nil {
+	if _, err := c.conn.Write(c.wbuf); err != nil {
 		return nil, fmt.Errorf("failed to write request: %w", err)
 	}
 
-	// Read response with context cancellation support
-	respChan := make(chan *models.Response, 1)
-	errChan := make(chan error, 1)
+	return index, nil
+}
 
-	go func() {
-		if err := c.conn.SetReadDeadline(time.Now().Add(c.timeout)); err != nil {
-			errChan <- fmt.Errorf("failed to set read deadline: %w", err)
-			return
-		}
+// readResponses waits for a response to every request in index, decoding each
+// into R and returning them in request order
+func readResponses[R any](ctx context.Context, c *Connection, index map[string]int, responseID func(*R) string) ([]*R, error) {
+	// Apply timeout if not already set
+	if _, ok := ctx.Deadline(); !ok && c.timeout > 0 {
+		var cancel context.CancelFunc
+		ctx, cancel = context.WithTimeout(ctx, c.timeout)
+		defer cancel()
+	}
+
+	// Read responses inline; the runtime network poller waits for readiness,
+	// and cancellation interrupts a blocked read by expiring its deadline
+	stop := context.AfterFunc(ctx, func() {
+		c.conn.SetReadDeadline(time.Now())
+	})
+	defer stop()
 
-		line, err := c.reader.ReadBytes('\n')
+	deadline := time.Now().Add(c.timeout)
+	if d, ok := ctx.Deadline(); ok && d.Before(deadline) {
+		deadline = d
+	}
+	if err := c.conn.SetReadDeadline(deadline); err != nil {
+		return nil, fmt.Errorf("failed to set read deadline: %w", err)
+	}
+
+	resps := make([]*R, len(index))
+	for pending := len(index); pending > 0; {
+		resp, err := readResponse[R](c)
 		if err != nil {
-			errChan <- fmt.Errorf("failed to read response: %w", err)
-			return
+			if ctx.Err() != nil {
+				return nil, fmt.Errorf("request cancelled or timed out: %w", ctx.Err())
+			}
+			return nil, err
 		}
 
-		var envelope models.MessageEnvelope
-		if err := json.Unmarshal(line, &envelope); err != nil {
-			errChan <- fmt.Errorf("failed to unmarshal response: %w", err)
-			return
+		// Skip responses that don't belong to this batch, e.g. a late
+		// reply to an earlier request that timed out
+		i, ok := index[responseID(resp)]
+		if !ok || resps[i] != nil {
+			continue
 		}
+		resps[i] = resp
+		pending--
+	}
 
-		if envelope.Type != "response" {
-			errChan <- fmt.Errorf("expected response, got %s", envelope.Type)
-			return
-		}
+	return resps, nil
+}
 
-		if envelope.Response == nil {
-			errChan <- fmt.Errorf("response envelope has nil response")
-			return
+// readResponse reads frames until a response envelope arrives. Events are
+// broadcast to every connected client, so they are skipped here rather than
+// treated as a protocol error.
+func readResponse[R any](c *Connection) (*R, error) {
+	for {
+		line, err := c.frames.next()
+		if err != nil {
+			return nil, fmt.Errorf("failed to read response: %w", err)
 		}
 
-		respChan <- envelope.Response
-	}()
+		var envelope responseEnvelope[R]
+		if err := json.Unmarshal(line, &envelope); err != nil {
+			return nil, fmt.Errorf("failed to unmarshal response: %w", err)
+		}
 
-	select {
-	case <-ctx.Done():
-		return nil, fmt.Errorf("request cancelled or timed out: %w", ctx.Err())
-	case err := <-errChan:
-		return nil, err
-	case resp := <-respChan:
-		return resp, nil
+		switch envelope.Type {
+		case "response":
+			if envelope.Response == nil {
+				return nil, fmt.Errorf("response envelope has nil response")
+			}
+			return envelope.Response, nil
+		case "event":
+			continue
+		default:
+			return nil, fmt.Errorf("expected response, got %s", envelope.Type)
+		}
 	}
 }
 
@@ -0,0 +1,43 @@
+package client
+
+import (
+	"bufio"
+	"io"
+)
+
+// frameReader splits a stream into newline-delimited frames. The delimiter
+// search runs over the reader's buffer, so a frame that fits in it is handed
+// back without copying; longer frames are accumulated in a buffer reused
+// across calls.
+type frameReader struct {
+	r    *bufio.Reader
+	line []byte
+}
+
+// newFrameReader creates a frameReader reading from r through a buffer of
+// the given size
+func newFrameReader(r io.Reader, size int) *frameReader {
+	return &frameReader{r: bufio.NewReaderSize(r, size)}
+}
+
+// next returns the next frame without its newline delimiter. The returned
+// slice is only valid until the next call.
+func (f *frameReader) next() ([]byte, error) {
+	chunk, err := f.r.ReadSlice('\n')
+	if err == nil {
+		return chunk[:len(chunk)-1], nil
+	}
+
+	f.line = f.line[:0]
+	for {
+		f.line = append(f.line, chunk...)
+		switch err {
+		case nil:
+			return f.line[:len(f.line)-1], nil
+		case bufio.ErrBufferFull:
+			chunk, err = f.r.ReadSlice('\n')
+		default:
+			return nil, err
+		}
+	}
+}
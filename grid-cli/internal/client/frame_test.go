@@ -0,0 +1,48 @@
+package client
+
+import (
+	"io"
+	"strings"
+	"testing"
+)
+
+func TestFrameReaderNext(t *testing.T) {
+	long := strings.Repeat("x", 100)
+
+	tests := []struct {
+		name  string
+		input string
+		want  []string
+	}{
+		{"single frame", "{\"a\":1}\n", []string{`{"a":1}`}},
+		{"several frames", "one\ntwo\n\nthree\n", []string{"one", "two", "", "three"}},
+		{"frame longer than buffer", long + "\nshort\n", []string{long, "short"}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			f := newFrameReader(strings.NewReader(tt.input), 16)
+
+			for i, want := range tt.want {
+				got, err := f.next()
+				if err != nil {
+					t.Fatalf("next() #%d error = %v", i, err)
+				}
+				if string(got) != want {
+					t.Errorf("next() #%d = %q, want %q", i, got, want)
+				}
+			}
+
+			if _, err := f.next(); err != io.EOF {
+				t.Errorf("next() at end error = %v, want io.EOF", err)
+			}
+		})
+	}
+}
+
+func TestFrameReaderUnterminated(t *testing.T) {
+	f := newFrameReader(strings.NewReader("partial"), 16)
+	if _, err := f.next(); err != io.EOF {
+		t.Errorf("next() error = %v, want io.EOF", err)
+	}
+}
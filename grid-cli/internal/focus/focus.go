@@ -97,23 +97,38 @@ func findFirstCellWithWindows(spaceState *state.SpaceState) string {
 
 // FocusWindow requests the server to focus a window.
 func FocusWindow(ctx context.Context, c *client.Client, windowID uint32) error {
+	return StartFocusWindow(c, windowID)(ctx)
+}
+
+// StartFocusWindow sends the focus request without waiting for the reply, so
+// the caller can do local work while the server handles it. The returned
+// function waits for the result, falling back to window.raise like
+// FocusWindow. It must be called before anything else is sent on c.
+func StartFocusWindow(c *client.Client, windowID uint32) func(ctx context.Context) error {
 	// Try window.focus first
-	_, err := c.CallMethod(ctx, "window.focus", map[string]interface{}{
-		"windowId": windowID,
-	})
-	if err == nil {
-		return nil
-	}
+	batch, err := c.StartBatch([]client.Call{{
+		Method: "window.focus",
+		Params: map[string]interface{}{"windowId": windowID},
+	}})
+
+	return func(ctx context.Context) error {
+		if err == nil {
+			results, err := batch.Wait(ctx)
+			if err == nil && results[0].Err == nil {
+				return nil
+			}
+		}
 
-	// Fallback to window.raise
-	_, err = c.CallMethod(ctx, "window.raise", map[string]interface{}{
-		"windowId": windowID,
-	})
-	if err != nil {
-		return fmt.Errorf("focus/raise failed for window %d: %w", windowID, err)
-	}
+		// Fallback to window.raise
+		_, err := c.CallMethod(ctx, "window.raise", map[string]interface{}{
+			"windowId": windowID,
+		})
+		if err != nil {
+			return fmt.Errorf("focus/raise failed for window %d: %w", windowID, err)
+		}
 
-	return nil
+		return nil
+	}
 }
 
 // MoveFocus moves focus to adjacent cell in direction.
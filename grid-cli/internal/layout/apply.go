@@ -133,20 +133,29 @@ func ApplyLayout(
 // ApplyPlacements sends window placements to the server.
 // Continues on individual errors to apply as many windows as possible.
 func ApplyPlacements(ctx context.Context, c *client.Client, placements []types.WindowPlacement) error {
-	successCount := 0
-	errorCount := 0
-
-	for _, p := range placements {
+	calls := make([]client.Call, len(placements))
+	for i, p := range placements {
 		updates := map[string]interface{}{
 			"x":      p.Bounds.X,
 			"y":      p.Bounds.Y,
 			"width":  p.Bounds.Width,
 			"height": p.Bounds.Height,
 		}
+		calls[i] = client.UpdateWindowCall(int(p.WindowID), updates)
+	}
+
+	// Send every placement in one batch rather than one round-trip per window
+	results, err := c.CallBatch(ctx, calls)
+	if err != nil {
+		return fmt.Errorf("failed to update windows: %w", err)
+	}
+
+	successCount := 0
+	errorCount := 0
 
-		_, err := c.UpdateWindow(ctx, int(p.WindowID), updates)
-		if err != nil {
-			fmt.Printf("Warning: failed to update window %d: %v\n", p.WindowID, err)
+	for i, r := range results {
+		if r.Err != nil {
+			fmt.Printf("Warning: failed to update window %d: %v\n", placements[i].WindowID, r.Err)
 			errorCount++
 		} else {
 			successCount++
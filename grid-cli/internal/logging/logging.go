@@ -3,6 +3,7 @@ package logging
 import (
 	"os"
 	"path/filepath"
+	"sync/atomic"
 	"time"
 
 	"github.com/rs/zerolog"
@@ -11,13 +12,35 @@ import (
 var (
 	Logger  zerolog.Logger
 	logFile *os.File
+
+	lastTimestamp atomic.Pointer[cachedTimestamp]
 )
 
+// cachedTimestamp is a formatted timestamp and the Unix second it was built for
+type cachedTimestamp struct {
+	unix      int64
+	formatted string
+}
+
 // timestampHook adds timestamp at the end of each log event
 type timestampHook struct{}
 
 func (h timestampHook) Run(e *zerolog.Event, level zerolog.Level, msg string) {
-	e.Time("ts", time.Now())
+	e.Str("ts", timestamp(time.Now()))
+}
+
+// timestamp formats t with zerolog's time format. That format has one-second
+// resolution, so the string is built once per second and reused by every
+// event logged within it.
+func timestamp(t time.Time) string {
+	sec := t.Unix()
+	if ts := lastTimestamp.Load(); ts != nil && ts.unix == sec {
+		return ts.formatted
+	}
+
+	ts := &cachedTimestamp{unix: sec, formatted: t.Format(zerolog.TimeFieldFormat)}
+	lastTimestamp.Store(ts)
+	return ts.formatted
 }
 
 // Init initializes the logging system with zerolog
@@ -2,6 +2,7 @@ package models
 
 import (
 	"encoding/json"
+	"sync"
 	"time"
 )
 
@@ -53,6 +54,73 @@ func NewRequest(id, method string, params map[string]interface{}) *MessageEnvelo
 	}
 }
 
+// AppendEnvelopeJSON appends the request wrapped in its message envelope to
+// dst, producing JSON equivalent to marshaling NewRequest's result. The
+// envelope shape is fixed, so it is written directly and only the params go
+// through the reflective encoder. The request ID is written after the params
+// so everything before them depends only on the method and can be cached.
+func (r *Request) AppendEnvelopeJSON(dst []byte) ([]byte, error) {
+	start := len(dst)
+	dst = append(dst, envelopePrefix(r.Method)...)
+
+	// Encode params straight onto dst. json.Marshal would hand back its own
+	// copy of the encoded bytes, which for large params is a second full copy
+	w := appendWriter{buf: dst}
+	if err := json.NewEncoder(&w).Encode(r.Params); err != nil {
+		return dst[:start], err
+	}
+	dst = w.buf[:len(w.buf)-1] // drop the newline Encode terminates values with
+
+	dst = append(dst, `,"id":`...)
+	dst = appendJSONString(dst, r.ID)
+	dst = append(dst, `},"response":null,"event":null}`...)
+	return dst, nil
+}
+
+// envelopePrefixes caches the envelope bytes leading up to the params for
+// each method. Clients call a small fixed set of methods, so it stays small.
+var envelopePrefixes sync.Map // method -> []byte
+
+// envelopePrefix returns the start of a request envelope for method, up to
+// and including the params key
+func envelopePrefix(method string) []byte {
+	if prefix, ok := envelopePrefixes.Load(method); ok {
+		return prefix.([]byte)
+	}
+
+	prefix := []byte(`{"type":"request","request":{"method":`)
+	prefix = appendJSONString(prefix, method)
+	prefix = append(prefix, `,"params":`...)
+	envelopePrefixes.Store(method, prefix)
+	return prefix
+}
+
+// appendWriter is an io.Writer that appends to a byte slice
+type appendWriter struct {
+	buf []byte
+}
+
+func (w *appendWriter) Write(p []byte) (int, error) {
+	w.buf = append(w.buf, p...)
+	return len(p), nil
+}
+
+// appendJSONString appends s as a quoted JSON string. IDs and method names are
+// plain ASCII and are copied as-is; anything encoding/json would escape falls
+// back to it so the output stays identical.
+func appendJSONString(dst []byte, s string) []byte {
+	for i := 0; i < len(s); i++ {
+		if b := s[i]; b < 0x20 || b >= 0x80 || b == '"' || b == '\\' || b == '<' || b == '>' || b == '&' {
+			quoted, _ := json.Marshal(s)
+			return append(dst, quoted...)
+		}
+	}
+
+	dst = append(dst, '"')
+	dst = append(dst, s...)
+	return append(dst, '"')
+}
+
 // IsError returns true if the response contains an error
 func (r *Response) IsError() bool {
 	return r.Error != nil
@@ -65,13 +133,3 @@ func (r *Response) GetError() string {
 	}
 	return ""
 }
-
-// MarshalJSON implements custom JSON marshaling for MessageEnvelope
-func (m *MessageEnvelope) MarshalJSON() ([]byte, error) {
-	type Alias MessageEnvelope
-	return json.Marshal(&struct {
-		*Alias
-	}{
-		Alias: (*Alias)(m),
-	})
-}
@@ -0,0 +1,86 @@
+package models
+
+import (
+	"encoding/json"
+	"reflect"
+	"strings"
+	"testing"
+)
+
+func TestAppendEnvelopeJSONMatchesMarshal(t *testing.T) {
+	tests := []struct {
+		name   string
+		id     string
+		method string
+		params map[string]interface{}
+	}{
+		{"nil params", "1", "ping", nil},
+		{"empty params", "2", "dump", map[string]interface{}{}},
+		{"nested params", "3", "updateWindow", map[string]interface{}{
+			"windowId": 42,
+			"x":        10.5,
+			"spaceId":  "7",
+			"frame":    []interface{}{1, 2},
+		}},
+		{"escaped strings", "a\"b", "<method>&é", map[string]interface{}{"k": "\n"}},
+		{"large params", "4", "echo", map[string]interface{}{
+			"data": strings.Repeat("x<y>&", 8192),
+		}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			env := NewRequest(tt.id, tt.method, tt.params)
+
+			marshaled, err := json.Marshal(env)
+			if err != nil {
+				t.Fatalf("json.Marshal() error = %v", err)
+			}
+			var want interface{}
+			if err := json.Unmarshal(marshaled, &want); err != nil {
+				t.Fatalf("json.Unmarshal() error = %v", err)
+			}
+
+			// Run twice so the second pass uses the cached method prefix
+			for pass := 0; pass < 2; pass++ {
+				appended, err := env.Request.AppendEnvelopeJSON(nil)
+				if err != nil {
+					t.Fatalf("AppendEnvelopeJSON() error = %v", err)
+				}
+
+				var got interface{}
+				if err := json.Unmarshal(appended, &got); err != nil {
+					t.Fatalf("AppendEnvelopeJSON() produced invalid JSON %s: %v", appended, err)
+				}
+
+				if !reflect.DeepEqual(got, want) {
+					t.Errorf("AppendEnvelopeJSON() = %s, want %s", appended, marshaled)
+				}
+			}
+		})
+	}
+}
+
+func TestAppendEnvelopeJSONAppends(t *testing.T) {
+	dst := []byte("prefix")
+	got, err := NewRequest("1", "ping", nil).Request.AppendEnvelopeJSON(dst)
+	if err != nil {
+		t.Fatalf("AppendEnvelopeJSON() error = %v", err)
+	}
+
+	if string(got[:len(dst)]) != "prefix" {
+		t.Errorf("AppendEnvelopeJSON() overwrote dst: %s", got)
+	}
+}
+
+func TestAppendEnvelopeJSONError(t *testing.T) {
+	dst := []byte("prefix")
+	got, err := NewRequest("1", "echo", map[string]interface{}{"bad": func() {}}).Request.AppendEnvelopeJSON(dst)
+	if err == nil {
+		t.Fatal("AppendEnvelopeJSON() error = nil, want unsupported type error")
+	}
+
+	if string(got) != "prefix" {
+		t.Errorf("AppendEnvelopeJSON() left partial output: %s", got)
+	}
+}
@@ -3,6 +3,7 @@ package models
 import (
 	"encoding/json"
 	"fmt"
+	"strconv"
 	"time"
 )
 
@@ -316,10 +317,10 @@ func (s *State) GetApplications() []*Application {
 
 // FindWindowByID finds a window by its ID
 func (s *State) FindWindowByID(id int) *Window {
-	return s.Windows[fmt.Sprintf("%d", id)]
+	return s.Windows[strconv.Itoa(id)]
 }
 
 // FindApplicationByPID finds an application by its PID
 func (s *State) FindApplicationByPID(pid int) *Application {
-	return s.Applications[fmt.Sprintf("%d", pid)]
+	return s.Applications[strconv.Itoa(pid)]
 }
@@ -1,6 +1,7 @@
 package output
 
 import (
+	"bufio"
 	"fmt"
 	"os"
 	"sort"
@@ -12,7 +13,10 @@ import (
 
 // PrintWindowsTable prints windows in a table format
 func PrintWindowsTable(windows []*models.Window) {
-	table := tablewriter.NewWriter(os.Stdout)
+	out := bufio.NewWriter(os.Stdout)
+	defer out.Flush()
+
+	table := tablewriter.NewWriter(out)
 	table.Header("ID", "Title", "App", "Space", "Size", "Minimized")
 
 	// Sort by ID
@@ -52,7 +56,10 @@ func PrintWindowsTable(windows []*models.Window) {
 
 // PrintSpacesTable prints spaces in a table format
 func PrintSpacesTable(spaces []*models.Space) {
-	table := tablewriter.NewWriter(os.Stdout)
+	out := bufio.NewWriter(os.Stdout)
+	defer out.Flush()
+
+	table := tablewriter.NewWriter(out)
 	table.Header("ID", "UUID", "Type", "Display", "Active", "Windows")
 
 	for _, space := range spaces {
@@ -79,7 +86,10 @@ func PrintSpacesTable(spaces []*models.Space) {
 
 // PrintDisplaysTable prints displays in a table format
 func PrintDisplaysTable(displays []*models.Display) {
-	table := tablewriter.NewWriter(os.Stdout)
+	out := bufio.NewWriter(os.Stdout)
+	defer out.Flush()
+
+	table := tablewriter.NewWriter(out)
 	table.Header("Name", "ID", "Resolution", "Scale", "Type", "Refresh", "Spaces")
 
 	for _, display := range displays {
@@ -117,7 +127,10 @@ func PrintDisplaysTable(displays []*models.Display) {
 
 // PrintApplicationsTable prints applications in a table format
 func PrintApplicationsTable(apps []*models.Application) {
-	table := tablewriter.NewWriter(os.Stdout)
+	out := bufio.NewWriter(os.Stdout)
+	defer out.Flush()
+
+	table := tablewriter.NewWriter(out)
 	table.Header("PID", "Name", "Bundle ID", "Active", "Hidden", "Windows")
 
 	// Sort by name
@@ -153,7 +166,10 @@ func PrintApplicationsTable(apps []*models.Application) {
 
 // PrintWindowDetail prints detailed information about a single window
 func PrintWindowDetail(win *models.Window, app *models.Application) {
-	fmt.Printf("Window ID: %d\n", win.ID)
+	out := bufio.NewWriter(os.Stdout)
+	defer out.Flush()
+
+	fmt.Fprintf(out, "Window ID: %d\n", win.ID)
 	title := ""
 	if win.Title != nil {
 		title = *win.Title
@@ -162,19 +178,19 @@ func PrintWindowDetail(win *models.Window, app *models.Application) {
 	if win.AppName != nil {
 		appName = *win.AppName
 	}
-	fmt.Printf("Title: %s\n", title)
-	fmt.Printf("Application: %s (PID: %d)\n", appName, win.PID)
+	fmt.Fprintf(out, "Title: %s\n", title)
+	fmt.Fprintf(out, "Application: %s (PID: %d)\n", appName, win.PID)
 	if app != nil {
-		fmt.Printf("Bundle ID: %s\n", app.BundleIdentifier)
+		fmt.Fprintf(out, "Bundle ID: %s\n", app.BundleIdentifier)
 	}
-	fmt.Printf("Position: (%.0f, %.0f)\n", win.GetX(), win.GetY())
-	fmt.Printf("Size: %.0fx%.0f\n", win.GetWidth(), win.GetHeight())
-	fmt.Printf("Frame: %s\n", win.FormatFrame())
-	fmt.Printf("Spaces: %v\n", win.Spaces)
-	fmt.Printf("Minimized: %v\n", win.IsMinimized)
-	fmt.Printf("Ordered In: %v\n", win.IsOrderedIn)
-	fmt.Printf("Alpha: %v\n", win.Alpha)
-	fmt.Printf("Has Transform: %v\n", win.HasTransform)
+	fmt.Fprintf(out, "Position: (%.0f, %.0f)\n", win.GetX(), win.GetY())
+	fmt.Fprintf(out, "Size: %.0fx%.0f\n", win.GetWidth(), win.GetHeight())
+	fmt.Fprintf(out, "Frame: %s\n", win.FormatFrame())
+	fmt.Fprintf(out, "Spaces: %v\n", win.Spaces)
+	fmt.Fprintf(out, "Minimized: %v\n", win.IsMinimized)
+	fmt.Fprintf(out, "Ordered In: %v\n", win.IsOrderedIn)
+	fmt.Fprintf(out, "Alpha: %v\n", win.Alpha)
+	fmt.Fprintf(out, "Has Transform: %v\n", win.HasTransform)
 }
 
 // Helper functions
@@ -3,6 +3,7 @@ package server
 import (
 	"context"
 	"fmt"
+	"strconv"
 
 	"github.com/yourusername/grid-cli/internal/client"
 	"github.com/yourusername/grid-cli/internal/types"
@@ -228,12 +229,19 @@ func findDisplayBounds(raw map[string]interface{}, activeDisplayUUID string) (ty
 func parseWindows(raw map[string]interface{}, spaceID string) []WindowInfo {
 	var windows []WindowInfo
 
+	// Compare space membership numerically rather than formatting every
+	// space of every window back to a string
+	spaceNum, err := strconv.ParseInt(spaceID, 10, 64)
+	if err != nil {
+		return windows
+	}
+
 	rawWindows, ok := raw["windows"].(map[string]interface{})
 	if !ok {
 		// Try as array
 		if rawArr, ok := raw["windows"].([]interface{}); ok {
 			for _, w := range rawArr {
-				if win := parseWindow(w, spaceID); win != nil {
+				if win := parseWindow(w, spaceNum); win != nil {
 					windows = append(windows, *win)
 				}
 			}
@@ -242,7 +250,7 @@ func parseWindows(raw map[string]interface{}, spaceID string) []WindowInfo {
 	}
 
 	for _, w := range rawWindows {
-		if win := parseWindow(w, spaceID); win != nil {
+		if win := parseWindow(w, spaceNum); win != nil {
 			windows = append(windows, *win)
 		}
 	}
@@ -250,7 +258,7 @@ func parseWindows(raw map[string]interface{}, spaceID string) []WindowInfo {
 	return windows
 }
 
-func parseWindow(w interface{}, spaceID string) *WindowInfo {
+func parseWindow(w interface{}, spaceID int64) *WindowInfo {
 	win, ok := w.(map[string]interface{})
 	if !ok {
 		return nil
@@ -267,8 +275,7 @@ func parseWindow(w interface{}, spaceID string) *WindowInfo {
 	if ok {
 		onSpace := false
 		for _, s := range spaces {
-			spaceVal := fmt.Sprintf("%v", interfaceToInt(s))
-			if spaceVal == spaceID {
+			if interfaceToInt(s) == spaceID {
 				onSpace = true
 				break
 			}
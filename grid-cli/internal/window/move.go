@@ -196,11 +196,8 @@ func moveWindowToCell(
 		return nil, fmt.Errorf("failed to apply placements: %w", err)
 	}
 
-	// Focus the window
-	if err := focus.FocusWindow(ctx, c, windowID); err != nil {
-		logging.Warn().Err(err).Uint32("windowId", windowID).Msg("failed to focus moved window")
-		// Non-fatal - window was moved successfully
-	}
+	// Focus the window, saving state while the server handles the request
+	waitFocus := focus.StartFocusWindow(c, windowID)
 
 	// Save state
 	rs.MarkUpdated()
@@ -208,6 +205,11 @@ func moveWindowToCell(
 		logging.Warn().Err(err).Msg("failed to save state")
 	}
 
+	if err := waitFocus(ctx); err != nil {
+		logging.Warn().Err(err).Uint32("windowId", windowID).Msg("failed to focus moved window")
+		// Non-fatal - window was moved successfully
+	}
+
 	return &MoveResult{
 		WindowID:     windowID,
 		SourceCell:   sourceCell,
@@ -374,10 +376,8 @@ func moveWindowCrossDisplay(
 		}
 	}
 
-	// Focus the window
-	if err := focus.FocusWindow(ctx, c, windowID); err != nil {
-		logging.Warn().Err(err).Uint32("windowId", windowID).Msg("failed to focus moved window")
-	}
+	// Focus the window, saving state while the server handles the request
+	waitFocus := focus.StartFocusWindow(c, windowID)
 
 	// Save state
 	rs.MarkUpdated()
@@ -385,6 +385,10 @@ func moveWindowCrossDisplay(
 		logging.Warn().Err(err).Msg("failed to save state")
 	}
 
+	if err := waitFocus(ctx); err != nil {
+		logging.Warn().Err(err).Uint32("windowId", windowID).Msg("failed to focus moved window")
+	}
+
 	return &MoveResult{
 		WindowID:     windowID,
 		SourceCell:   currentCell,
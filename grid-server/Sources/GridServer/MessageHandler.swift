@@ -109,6 +109,37 @@ class MessageHandler {
             }
         }
 
+        // GetWindow - returns a single window and its owning application
+        register(method: "getWindow") { request, completion in
+            guard let params = request.params,
+                  let windowIdWrapper = params["windowId"],
+                  let windowId = windowIdWrapper.value as? Int else {
+                let response = Response(
+                    id: request.id,
+                    error: ErrorInfo(code: -32602, message: "Invalid params: windowId is required")
+                )
+                completion(response)
+                return
+            }
+
+            let state = StateManager.shared.getState()
+            guard let windowState = state.windows[String(windowId)] else {
+                let response = Response(
+                    id: request.id,
+                    error: ErrorInfo(code: -32001, message: "Window not found: \(windowId)")
+                )
+                completion(response)
+                return
+            }
+
+            var result: [String: Any] = ["window": windowState]
+            if let appState = state.applications[String(windowState.pid)] {
+                result["application"] = appState
+            }
+
+            completion(Response(id: request.id, result: AnyCodable(result)))
+        }
+
         // UpdateWindow - manipulate window position, size, space, or display
         register(method: "updateWindow") { [weak self] request, completion in
             guard let self = self else {
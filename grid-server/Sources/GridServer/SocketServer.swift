@@ -8,6 +8,7 @@ class SocketServer {
     private var serverSocket: Int32?
     private var isRunning = false
     private var clientSockets: Set<Int32> = []
+    private var clientSources: [Int32: DispatchSourceRead] = [:]
     private let clientQueue = DispatchQueue(label: "com.thegrid.client", attributes: .concurrent)
     private let socketQueue = DispatchQueue(label: "com.thegrid.socket")
 
@@ -77,12 +78,11 @@ class SocketServer {
     func stop() {
         isRunning = false
 
-        // Close all client sockets
+        // Cancel all client read sources; each cancel handler closes its socket
         socketQueue.sync {
-            for clientSocket in clientSockets {
-                close(clientSocket)
+            for source in clientSources.values {
+                source.cancel()
             }
-            clientSockets.removeAll()
         }
 
         // Close server socket
@@ -122,33 +122,33 @@ class SocketServer {
                 self?.clientSockets.insert(clientSocket)
             }
 
-            // Handle client on separate queue
-            clientQueue.async { [weak self] in
-                self?.handleClient(socket: clientSocket)
-            }
+            handleClient(socket: clientSocket)
         }
     }
 
     /// Handle communication with a single client
+    ///
+    /// Reads are driven by a dispatch read source, so an idle client does not
+    /// hold a worker thread blocked in recv between requests.
     private func handleClient(socket: Int32) {
-        defer {
-            close(socket)
-            socketQueue.async(flags: .barrier) { [weak self] in
-                self?.clientSockets.remove(socket)
-            }
-            logger.info("Client disconnected", metadata: ["socket": "\(socket)"])
-        }
-
         var buffer = Data()
         let readSize = 4096
+        var chunk = [UInt8](repeating: 0, count: readSize)
+
+        let source = DispatchSource.makeReadSource(fileDescriptor: socket, queue: clientQueue)
+
+        source.setEventHandler { [weak self] in
+            guard let self = self, self.isRunning else {
+                source.cancel()
+                return
+            }
 
-        while isRunning {
-            var chunk = [UInt8](repeating: 0, count: readSize)
             let bytesRead = recv(socket, &chunk, readSize, 0)
 
             if bytesRead <= 0 {
                 // Connection closed or error
-                break
+                source.cancel()
+                return
             }
 
             buffer.append(contentsOf: chunk[0..<bytesRead])
@@ -159,10 +159,27 @@ class SocketServer {
                 buffer.removeSubrange(...newlineIndex)
 
                 if !messageData.isEmpty {
-                    processMessage(data: messageData, clientSocket: socket)
+                    self.processMessage(data: messageData, clientSocket: socket)
                 }
             }
         }
+
+        source.setCancelHandler { [weak self] in
+            // Forget the socket before closing it so a new client reusing
+            // the descriptor is never removed by mistake
+            self?.socketQueue.sync {
+                self?.clientSockets.remove(socket)
+                self?.clientSources[socket] = nil
+            }
+            close(socket)
+            self?.logger.info("Client disconnected", metadata: ["socket": "\(socket)"])
+        }
+
+        socketQueue.async(flags: .barrier) { [weak self] in
+            self?.clientSources[socket] = source
+        }
+
+        source.resume()
     }
 
     /// Process a received message